@@ -0,0 +1,148 @@
+"""Numba-compiled kernels for Dubins path lengths.
+
+All functions operate on plain floats so that a request only pays for the
+arithmetic, not for Python method dispatch or NumPy scalar boxing. They
+release the GIL, so large batches do not stall other request threads.
+
+Path types are indexed in the order of ``DUBINS_PATH_TYPES``:
+LSL, RSR, LSR, RSL, LRL, RLR. Turn directions follow
+``DubinsPathCalculator.left_circle_center``.
+"""
+
+import math
+import numpy as np
+from numba import njit
+
+# fastmath without the no-NaN/no-inf flags: infeasible words rely on them
+_FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+_TWO_PI = 2 * math.pi
+# Tolerance (unit radius) for zero-length arcs and straights. Kept above the
+# 1e-9 rounding applied by the relative-pose cache in dubins_paths.
+_ANGLE_EPS = 1e-8
+
+@njit(cache=True, nogil=True, fastmath=_FASTMATH)
+def mod2pi(theta):
+    """Wrap an angle to [0, 2*pi).
+
+    Results within _ANGLE_EPS of 2*pi snap to 0, so rounding noise on a
+    zero-length arc does not turn it into a full loop.
+    """
+    # Float modulo: math.floor returns an int64 here, which overflows for
+    # very large angles
+    wrapped = theta % _TWO_PI
+    return 0.0 if wrapped > _TWO_PI - _ANGLE_EPS else wrapped
+
+@njit(cache=True, nogil=True, fastmath=_FASTMATH)
+def dubins_lengths(x0, y0, th0, x1, y1, th1, r):
+    """Closed-form lengths of the 6 Dubins words between two poses.
+
+    Returns a length-6 array with ``inf`` marking infeasible words.
+    """
+    # Canonical frame: start at the origin, end on the positive x axis,
+    # unit radius. Mirror y so that L turns counter-clockwise.
+    dx = x1 - x0
+    dy = y0 - y1
+    d = math.hypot(dx, dy) / r
+    phi = math.atan2(dy, dx)
+    # Wrap the headings first: phi would vanish in rounding next to a huge
+    # raw heading
+    alpha = mod2pi(mod2pi(-th0) - phi)
+    beta = mod2pi(mod2pi(-th1) - phi)
+
+    sa, ca = math.sin(alpha), math.cos(alpha)
+    sb, cb = math.sin(beta), math.cos(beta)
+    c_ab = math.cos(alpha - beta)
+    d2 = d * d
+
+    lengths = np.empty(6)
+
+    # LSL: when both turns share one circle (p = 0) the straight direction
+    # is undefined and the path is a single arc
+    p = math.hypot(d + sa - sb, cb - ca)
+    if p > _ANGLE_EPS:
+        tmp = math.atan2(cb - ca, d + sa - sb)
+        lengths[0] = mod2pi(tmp - alpha) + p + mod2pi(beta - tmp)
+    else:
+        lengths[0] = mod2pi(beta - alpha)
+
+    # RSR
+    p = math.hypot(d - sa + sb, ca - cb)
+    if p > _ANGLE_EPS:
+        tmp = math.atan2(ca - cb, d - sa + sb)
+        lengths[1] = mod2pi(alpha - tmp) + p + mod2pi(tmp - beta)
+    else:
+        lengths[1] = mod2pi(alpha - beta)
+
+    # LSR: the straight segment exists only if p^2 >= 0
+    p_sq = -2 + d2 + 2 * c_ab + 2 * d * (sa + sb)
+    if p_sq >= 0:
+        p = math.sqrt(p_sq)
+        tmp = math.atan2(-ca - cb, d + sa + sb) - math.atan2(-2.0, p)
+        lengths[2] = mod2pi(tmp - alpha) + p + mod2pi(tmp - beta)
+    else:
+        lengths[2] = math.inf
+
+    # RSL
+    p_sq = -2 + d2 + 2 * c_ab - 2 * d * (sa + sb)
+    if p_sq >= 0:
+        p = math.sqrt(p_sq)
+        tmp = math.atan2(ca + cb, d - sa - sb) - math.atan2(2.0, p)
+        lengths[3] = mod2pi(alpha - tmp) + p + mod2pi(beta - tmp)
+    else:
+        lengths[3] = math.inf
+
+    # LRL: the middle circle exists only if |cos p| <= 1
+    cos_p = (6 - d2 + 2 * c_ab + 2 * d * (sb - sa)) / 8
+    if abs(cos_p) <= 1:
+        p = mod2pi(_TWO_PI - math.acos(cos_p))
+        t = mod2pi(-alpha - math.atan2(ca - cb, d + sa - sb) + p / 2)
+        lengths[4] = t + p + mod2pi(beta - alpha - t + p)
+    else:
+        lengths[4] = math.inf
+
+    # RLR
+    cos_p = (6 - d2 + 2 * c_ab + 2 * d * (sa - sb)) / 8
+    if abs(cos_p) <= 1:
+        p = mod2pi(_TWO_PI - math.acos(cos_p))
+        t = mod2pi(alpha - math.atan2(ca - cb, d - sa + sb) + p / 2)
+        lengths[5] = t + p + mod2pi(alpha - beta - t + p)
+    else:
+        lengths[5] = math.inf
+
+    for i in range(6):
+        lengths[i] *= r
+    return lengths
+
+@njit(cache=True, nogil=True, fastmath=_FASTMATH)
+def dubins_all(x0, y0, th0, x1, y1, th1, r):
+    """Type code and length of the shortest Dubins path between two poses."""
+    lengths = dubins_lengths(x0, y0, th0, x1, y1, th1, r)
+    best = 0
+    for i in range(1, 6):
+        if lengths[i] < lengths[best]:
+            best = i
+    return best, lengths[best]
+
+@njit(cache=True, nogil=True, fastmath=_FASTMATH)
+def dubins_batch(starts, ends, r):
+    """Shortest Dubins path for each row of two (n, 3) pose arrays.
+
+    Rows are (x, y, theta). Returns the type codes and lengths as two
+    length-n arrays.
+    """
+    n = starts.shape[0]
+    types = np.empty(n, dtype=np.int64)
+    lengths = np.empty(n)
+    for i in range(n):
+        types[i], lengths[i] = dubins_all(
+            starts[i, 0], starts[i, 1], starts[i, 2],
+            ends[i, 0], ends[i, 1], ends[i, 2],
+            r
+        )
+    return types, lengths
+
+# Compile (or load from the on-disk cache) at import time so that the first
+# request does not pay the JIT cost.
+dubins_all(0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 1.0)
+dubins_batch(np.zeros((1, 3)), np.ones((1, 3)), 1.0)
@@ -6,28 +6,44 @@ Provides RESTful endpoints for:
 - Knot topology analysis
 """
 
+from anyio import to_thread
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from functools import lru_cache
 from time import time
+from typing import List
 import logging
+import os
 
 from .models import (
     Pose2D, DubinsPathRequest, DubinsPathResponse,
-    FlexibleEnvelopeRequest, FlexibleEnvelopeResponse,
-    EnvelopePoint
+    DubinsBatchRequest, DubinsBatchResponse,
+    FlexibleEnvelopeRequest, FlexibleEnvelopeResponse
 )
-from .dubins_paths import DubinsPathCalculator
+from .dubins_paths import DubinsPathCalculator, DUBINS_PATH_TYPES
 import numpy as np
+from scipy.spatial import ConvexHull
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Size the threadpool that runs the CPU-bound (def) endpoints."""
+    limiter = to_thread.current_default_thread_limiter()
+    limiter.total_tokens = max(40, (os.cpu_count() or 1) * 4)
+    yield
+
 # Create FastAPI application
 app = FastAPI(
     title="Knots API",
     description="High-precision mathematical research platform for knot topology and Dubins paths",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -42,6 +58,22 @@ app.add_middleware(
 # Initialize Dubins path calculator
 dubins_calculator = DubinsPathCalculator(min_radius=1.0)
 
+@lru_cache(maxsize=32)
+def _calculator_for_radius(min_radius: float) -> DubinsPathCalculator:
+    """Cached calculator per radius; the calculator is stateless."""
+    return DubinsPathCalculator(min_radius=min_radius)
+
+def _get_calculator(min_radius: float) -> DubinsPathCalculator:
+    """Shared calculator for a requested radius.
+
+    The default radius reuses dubins_calculator. Other radii are rounded to
+    9 significant digits, so nearby floats share a cache entry without small
+    radii collapsing to zero.
+    """
+    if min_radius == dubins_calculator.min_radius:
+        return dubins_calculator
+    return _calculator_for_radius(float(f"{min_radius:.9g}"))
+
 # ========== Health & Info Endpoints ==========
 
 @app.get("/health")
@@ -65,7 +97,7 @@ async def api_info():
 # ========== Dubins Path Endpoints ==========
 
 @app.post("/api/dubins/compute", response_model=DubinsPathResponse)
-async def compute_dubins_path(request: DubinsPathRequest) -> DubinsPathResponse:
+def compute_dubins_path(request: DubinsPathRequest) -> DubinsPathResponse:
     """Compute optimal Dubins path between two poses.
     
     Args:
@@ -84,31 +116,16 @@ async def compute_dubins_path(request: DubinsPathRequest) -> DubinsPathResponse:
                 detail="min_radius must be positive"
             )
         
-        # Update calculator with provided radius
-        calculator = DubinsPathCalculator(min_radius=request.min_radius)
+        # Reuse a shared calculator for the provided radius
+        calculator = _get_calculator(request.min_radius)
         
-        # Compute optimal path
-        optimal_path = calculator.compute_optimal_path(
+        # Compute optimal path and, optionally, all 6 paths in one pass
+        optimal_path, all_paths = calculator.compute_optimal_path(
             request.start_pose,
-            request.end_pose
+            request.end_pose,
+            compute_all=request.compute_all
         )
         
-        # Optionally compute all 6 paths
-        all_paths = None
-        if request.compute_all:
-            all_paths = []
-            for path_func in [
-                calculator.compute_lsl,
-                calculator.compute_rsr,
-                calculator.compute_lsr,
-                calculator.compute_rsl,
-                calculator.compute_lrl,
-                calculator.compute_rlr,
-            ]:
-                path = path_func(request.start_pose, request.end_pose)
-                if path:
-                    all_paths.append(path)
-        
         computation_time_ms = (time() - start_time) * 1000
         
         return DubinsPathResponse(
@@ -127,25 +144,81 @@ async def compute_dubins_path(request: DubinsPathRequest) -> DubinsPathResponse:
             detail="Internal server error during Dubins path computation"
         )
 
+def _pack_poses(poses: List[Pose2D]) -> np.ndarray:
+    """Pack poses into an (n, 3) array of (x, y, theta) rows."""
+    n = len(poses)
+    return np.fromiter(
+        (c for p in poses for c in (p.x, p.y, p.theta)),
+        dtype=np.float64,
+        count=3 * n
+    ).reshape(n, 3)
+
+@app.post("/api/dubins/compute_batch", response_model=DubinsBatchResponse)
+def compute_dubins_batch(request: DubinsBatchRequest) -> ORJSONResponse:
+    """Compute optimal Dubins paths for many (start, end) pairs in one call.
+    
+    Args:
+        request: DubinsBatchRequest with paired starts/ends and min_radius
+        
+    Returns:
+        DubinsBatchResponse with the optimal path type index and length per pair
+    """
+    if request.min_radius <= 0:
+        raise HTTPException(
+            status_code=400,
+            detail="min_radius must be positive"
+        )
+    if len(request.starts) != len(request.ends):
+        raise HTTPException(
+            status_code=400,
+            detail="starts and ends must have the same length"
+        )
+    
+    try:
+        start_time = time()
+        
+        calculator = _get_calculator(request.min_radius)
+        
+        path_types, lengths = calculator.compute_optimal_batch(
+            _pack_poses(request.starts),
+            _pack_poses(request.ends)
+        )
+        
+        computation_time_ms = (time() - start_time) * 1000
+        
+        # orjson serializes the NumPy arrays directly
+        return ORJSONResponse({
+            "path_types": path_types,
+            "lengths": lengths,
+            "computation_time_ms": computation_time_ms
+        })
+        
+    except Exception as e:
+        logger.error(f"Error computing Dubins batch: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail="Internal server error during Dubins batch computation"
+        )
+
+# Static path type table, in the kernel's index order, built once at import
+_SEGMENT_NAMES = {"L": "Left", "S": "Straight", "R": "Right"}
+DUBINS_INFO = {
+    "path_types": [
+        {"name": name, "description": "-".join(_SEGMENT_NAMES[c] for c in name)}
+        for name in DUBINS_PATH_TYPES
+    ],
+    "reference": "Diaz, A., & Ayala, L. (2020). Census of bounded curvature paths."
+}
+
 @app.get("/api/dubins/info")
 async def dubins_info():
     """Get information about Dubins path types."""
-    return {
-        "path_types": [
-            {"name": "LSL", "description": "Left-Straight-Left"},
-            {"name": "RSR", "description": "Right-Straight-Right"},
-            {"name": "LSR", "description": "Left-Straight-Right"},
-            {"name": "RSL", "description": "Right-Straight-Left"},
-            {"name": "LRL", "description": "Left-Right-Left"},
-            {"name": "RLR", "description": "Right-Left-Right"},
-        ],
-        "reference": "Diaz, A., & Ayala, L. (2020). Census of bounded curvature paths."
-    }
+    return DUBINS_INFO
 
 # ========== Envelope Endpoints ==========
 
 @app.post("/api/envelope/compute", response_model=FlexibleEnvelopeResponse)
-async def compute_flexible_envelope(request: FlexibleEnvelopeRequest) -> FlexibleEnvelopeResponse:
+def compute_flexible_envelope(request: FlexibleEnvelopeRequest) -> ORJSONResponse:
     """Compute convex hull of disk centers using SciPy.
     
     Returns the indices of the disks that form the convex hull in CCW order.
@@ -155,14 +228,20 @@ async def compute_flexible_envelope(request: FlexibleEnvelopeRequest) -> Flexibl
         start_time = time()
         
         if not request.disks:
-            return FlexibleEnvelopeResponse(
-                envelope_points=[],
-                convex_hull_indices=[],
-                smoothed_curve=[],
-                computation_time_ms=0
-            )
+            return ORJSONResponse({
+                "envelope_points": [],
+                "convex_hull_indices": [],
+                "smoothed_curve": [],
+                "computation_time_ms": 0
+            })
             
-        points = np.array([[d.center.x, d.center.y] for d in request.disks])
+        # Fill the (n, 2) buffer in one pass, without per-disk temporary lists
+        n = len(request.disks)
+        points = np.fromiter(
+            (c for d in request.disks for c in (d.center.x, d.center.y)),
+            dtype=np.float64,
+            count=2 * n
+        ).reshape(n, 2)
         
         if len(points) < 3:
             # Trivial case: all points are on hull
@@ -173,26 +252,27 @@ async def compute_flexible_envelope(request: FlexibleEnvelopeRequest) -> Flexibl
             pass
         else:
              # Compute Convex Hull
-            from scipy.spatial import ConvexHull
             hull = ConvexHull(points)
             hull_indices = hull.vertices.tolist() # Vertices are in CCW order by default in 2D
             
         # Ensure indices map back to original disks
         # SciPy returns indices into the points array, which matches request.disks order.
         
+        # The points come from validated input, so emit plain dicts straight
+        # from the hull slice and return them without re-validating each one.
         envelope_points = [
-            EnvelopePoint(x=request.disks[i].center.x, y=request.disks[i].center.y)
-            for i in hull_indices
+            {"x": x, "y": y, "tangent_angle": None}
+            for x, y in points[hull_indices].tolist()
         ]
         
         computation_time_ms = (time() - start_time) * 1000
         
-        return FlexibleEnvelopeResponse(
-            envelope_points=envelope_points,
-            convex_hull_indices=hull_indices,
-            smoothed_curve=[],
-            computation_time_ms=computation_time_ms
-        )
+        return ORJSONResponse({
+            "envelope_points": envelope_points,
+            "convex_hull_indices": hull_indices,
+            "smoothed_curve": [],
+            "computation_time_ms": computation_time_ms
+        })
 
     except Exception as e:
         logger.error(f"Error computing envelope: {str(e)}")
@@ -205,9 +285,15 @@ async def compute_flexible_envelope(request: FlexibleEnvelopeRequest) -> Flexibl
 
 if __name__ == "__main__":
     import uvicorn
+    # Multiple workers need the app as an import string, e.g. "app.app:app"
+    # when started with `python -m app.app` from backend/. "auto" picks
+    # uvloop/httptools when installed (not on Windows) and falls back otherwise.
     uvicorn.run(
-        app,
+        f"{__spec__.name}:app",
         host="0.0.0.0",
         port=8000,
-        log_level="info"
+        log_level="info",
+        workers=os.cpu_count(),
+        loop="auto",
+        http="auto"
     )
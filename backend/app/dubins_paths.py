@@ -12,179 +12,144 @@ Implements all 6 Dubins path types:
 - RLR (Right-Left-Right)
 """
 
+import math
 import numpy as np
-from typing import List, Optional, Tuple
+from dataclasses import dataclass
+from typing import ClassVar, List, Optional, Tuple
 from scipy.optimize import minimize
 from .models import Pose2D, DubinsSegment, DubinsPath
+from ._dubins_kernels import dubins_batch, dubins_lengths
 
+# Path types in the order returned by the kernels in _dubins_kernels
+DUBINS_PATH_TYPES = ("LSL", "RSR", "LSR", "RSL", "LRL", "RLR")
+
+@dataclass(frozen=True, slots=True)
 class DubinsPathCalculator:
-    """High-precision Dubins path calculator using NumPy."""
-    
-    def __init__(self, min_radius: float = 1.0):
-        """Initialize with minimum turning radius.
-        
-        Args:
-            min_radius: Minimum turning radius (default: 1.0)
-        """
-        self.min_radius = min_radius
-        self.EPS = 1e-10  # Numerical epsilon
+    """High-precision Dubins path calculator using NumPy.
+
+    Instances are immutable, so a single calculator can be shared across
+    request threads.
+
+    Args:
+        min_radius: Minimum turning radius (default: 1.0)
+    """
+
+    min_radius: float = 1.0
+    EPS: ClassVar[float] = 1e-10  # Numerical epsilon
     
     def normalize_angle(self, angle: float) -> float:
-        """Normalize angle to [-pi, pi]."""
-        while angle > np.pi:
-            angle -= 2 * np.pi
-        while angle < -np.pi:
-            angle += 2 * np.pi
-        return angle
+        """Normalize angle to [-pi, pi).
+
+        Also accepts NumPy arrays, which are normalized element-wise.
+        """
+        return (angle + math.pi) % (2 * math.pi) - math.pi
     
     def distance(self, p1: Pose2D, p2: Pose2D) -> float:
         """Euclidean distance between two points."""
-        return np.sqrt((p2.x - p1.x)**2 + (p2.y - p1.y)**2)
+        return math.hypot(p2.x - p1.x, p2.y - p1.y)
     
     def left_circle_center(self, pose: Pose2D) -> Pose2D:
         """Get center of left-turn circle."""
-        x = pose.x + self.min_radius * np.sin(pose.theta)
-        y = pose.y - self.min_radius * np.cos(pose.theta)
+        x = pose.x + self.min_radius * math.sin(pose.theta)
+        y = pose.y - self.min_radius * math.cos(pose.theta)
         return Pose2D(x=x, y=y, theta=0)
     
     def right_circle_center(self, pose: Pose2D) -> Pose2D:
         """Get center of right-turn circle."""
-        x = pose.x - self.min_radius * np.sin(pose.theta)
-        y = pose.y + self.min_radius * np.cos(pose.theta)
+        x = pose.x - self.min_radius * math.sin(pose.theta)
+        y = pose.y + self.min_radius * math.cos(pose.theta)
         return Pose2D(x=x, y=y, theta=0)
     
+    def _compute_all(self, start: Pose2D, end: Pose2D) -> Tuple[np.ndarray, int]:
+        """Evaluate the closed-form lengths of all 6 path types in one pass.
+
+        Returns the lengths ordered as DUBINS_PATH_TYPES (``inf`` for
+        infeasible types) and the index of the shortest one.
+        """
+        lengths = dubins_lengths(
+            start.x, start.y, start.theta,
+            end.x, end.y, end.theta,
+            self.min_radius
+        )
+        return lengths, int(np.argmin(lengths))
+
+    def _make_path(self, start: Pose2D, end: Pose2D, index: int, length: float) -> DubinsPath:
+        """Wrap a computed length into a DubinsPath.
+
+        The fields come from validated poses and the kernel, so validation is
+        skipped.
+        """
+        return DubinsPath.model_construct(
+            path_type=DUBINS_PATH_TYPES[index],
+            segments=[],
+            total_length=float(length),
+            start_pose=start,
+            end_pose=end
+        )
+
+    def _compute_variant(self, start: Pose2D, end: Pose2D, index: int) -> Optional[DubinsPath]:
+        """Compute a single path type, or None if it is infeasible."""
+        lengths, _ = self._compute_all(start, end)
+        if not math.isfinite(lengths[index]):
+            return None
+        return self._make_path(start, end, index, lengths[index])
+
     def compute_lsl(self, start: Pose2D, end: Pose2D) -> Optional[DubinsPath]:
         """Compute LSL path (Left-Straight-Left)."""
-        try:
-            c_start = self.left_circle_center(start)
-            c_end = self.left_circle_center(end)
-            d = self.distance(c_start, c_end)
-            
-            if d > 4 * self.min_radius:
-                return None
-            
-            # Simplified path construction
-            total_length = d + 2 * self.min_radius
-            return DubinsPath(
-                path_type="LSL",
-                segments=[],
-                total_length=total_length,
-                start_pose=start,
-                end_pose=end
-            )
-        except:
-            return None
-    
+        return self._compute_variant(start, end, 0)
+
     def compute_rsr(self, start: Pose2D, end: Pose2D) -> Optional[DubinsPath]:
         """Compute RSR path (Right-Straight-Right)."""
-        try:
-            c_start = self.right_circle_center(start)
-            c_end = self.right_circle_center(end)
-            d = self.distance(c_start, c_end)
-            
-            if d > 4 * self.min_radius:
-                return None
-            
-            total_length = d + 2 * self.min_radius
-            return DubinsPath(
-                path_type="RSR",
-                segments=[],
-                total_length=total_length,
-                start_pose=start,
-                end_pose=end
-            )
-        except:
-            return None
-    
+        return self._compute_variant(start, end, 1)
+
     def compute_lsr(self, start: Pose2D, end: Pose2D) -> Optional[DubinsPath]:
         """Compute LSR path (Left-Straight-Right)."""
-        try:
-            total_length = self.distance(start, end) + np.pi * self.min_radius
-            return DubinsPath(
-                path_type="LSR",
-                segments=[],
-                total_length=total_length,
-                start_pose=start,
-                end_pose=end
-            )
-        except:
-            return None
-    
+        return self._compute_variant(start, end, 2)
+
     def compute_rsl(self, start: Pose2D, end: Pose2D) -> Optional[DubinsPath]:
         """Compute RSL path (Right-Straight-Left)."""
-        try:
-            total_length = self.distance(start, end) + np.pi * self.min_radius
-            return DubinsPath(
-                path_type="RSL",
-                segments=[],
-                total_length=total_length,
-                start_pose=start,
-                end_pose=end
-            )
-        except:
-            return None
-    
+        return self._compute_variant(start, end, 3)
+
     def compute_lrl(self, start: Pose2D, end: Pose2D) -> Optional[DubinsPath]:
         """Compute LRL path (Left-Right-Left)."""
-        try:
-            total_length = 1.5 * np.pi * self.min_radius + self.distance(start, end)
-            return DubinsPath(
-                path_type="LRL",
-                segments=[],
-                total_length=total_length,
-                start_pose=start,
-                end_pose=end
-            )
-        except:
-            return None
-    
+        return self._compute_variant(start, end, 4)
+
     def compute_rlr(self, start: Pose2D, end: Pose2D) -> Optional[DubinsPath]:
         """Compute RLR path (Right-Left-Right)."""
-        try:
-            total_length = 1.5 * np.pi * self.min_radius + self.distance(start, end)
-            return DubinsPath(
-                path_type="RLR",
-                segments=[],
-                total_length=total_length,
-                start_pose=start,
-                end_pose=end
-            )
-        except:
-            return None
-    
-    def compute_optimal_path(self, start: Pose2D, end: Pose2D) -> DubinsPath:
+        return self._compute_variant(start, end, 5)
+
+    def compute_optimal_path(
+        self, start: Pose2D, end: Pose2D, compute_all: bool = False
+    ) -> Tuple[DubinsPath, Optional[List[DubinsPath]]]:
         """Compute optimal Dubins path from all 6 variants.
-        
-        Returns the shortest valid path.
+
+        Returns the shortest valid path and, if compute_all is set, every
+        feasible variant taken from the same evaluation (otherwise None).
+        LSL and RSR are always feasible, so a shortest path always exists.
+        """
+        lengths, best = self._compute_all(start, end)
+        optimal_path = self._make_path(start, end, best, lengths[best])
+
+        all_paths = None
+        if compute_all:
+            all_paths = [
+                self._make_path(start, end, i, length)
+                for i, length in enumerate(lengths)
+                if math.isfinite(length)
+            ]
+        return optimal_path, all_paths
+
+    def compute_optimal_batch(
+        self, starts: np.ndarray, ends: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Compute the optimal path for many pose pairs at once.
+
+        Args:
+            starts: (n, 3) array of start poses as (x, y, theta) rows
+            ends: (n, 3) array of end poses, paired row by row with starts
+
+        Returns:
+            Type codes (indices into DUBINS_PATH_TYPES) and lengths, both of
+            length n
         """
-        paths = []
-        
-        # Compute all 6 path types
-        lsl = self.compute_lsl(start, end)
-        rsr = self.compute_rsr(start, end)
-        lsr = self.compute_lsr(start, end)
-        rsl = self.compute_rsl(start, end)
-        lrl = self.compute_lrl(start, end)
-        rlr = self.compute_rlr(start, end)
-        
-        # Collect valid paths
-        if lsl: paths.append(lsl)
-        if rsr: paths.append(rsr)
-        if lsr: paths.append(lsr)
-        if rsl: paths.append(rsl)
-        if lrl: paths.append(lrl)
-        if rlr: paths.append(rlr)
-        
-        if not paths:
-            # Fallback: return straight line
-            d = self.distance(start, end)
-            return DubinsPath(
-                path_type="LSL",
-                segments=[],
-                total_length=d,
-                start_pose=start,
-                end_pose=end
-            )
-        
-        # Return shortest path
-        return min(paths, key=lambda p: p.total_length)
+        return dubins_batch(starts, ends, float(self.min_radius))
@@ -1,9 +1,14 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+from pydantic.dataclasses import dataclass
 from typing import List, Optional, Literal
 
+# Small value types that appear many times per payload are slotted
+# dataclasses rather than BaseModels, which keeps them cheap to build and store.
+
 # Dubins Path Models
 
-class Pose2D(BaseModel):
+@dataclass(slots=True)
+class Pose2D:
     """2D position and heading (x, y, theta)"""
     x: float
     y: float
@@ -39,14 +44,31 @@ class DubinsPathResponse(BaseModel):
     all_paths: Optional[List[DubinsPath]] = None
     computation_time_ms: float
 
+# Upper bound on pose pairs per batch request
+MAX_BATCH_SIZE = 10_000
+
+class DubinsBatchRequest(BaseModel):
+    """Request to compute optimal Dubins paths for many pose pairs"""
+    starts: List[Pose2D] = Field(max_length=MAX_BATCH_SIZE)
+    ends: List[Pose2D] = Field(max_length=MAX_BATCH_SIZE)  # Paired with starts by index
+    min_radius: float = 1.0
+
+class DubinsBatchResponse(BaseModel):
+    """Optimal path per pose pair, as parallel arrays"""
+    path_types: List[int]  # Indices into the /api/dubins/info path types
+    lengths: List[float]
+    computation_time_ms: float
+
 # Flexible Envelope Models
 
-class Disk(BaseModel):
+@dataclass(slots=True)
+class Disk:
     """Disk in 2D space (center + radius)"""
     center: Pose2D
     radius: float
 
-class EnvelopePoint(BaseModel):
+@dataclass(slots=True)
+class EnvelopePoint:
     """Point on the convex envelope"""
     x: float
     y: float
@@ -0,0 +1,270 @@
+"""Tests for the Dubins path kernel and endpoints.
+
+Lengths are checked against an independent construction that builds each
+path from the turning circles returned by left/right_circle_center.
+"""
+
+import math
+import random
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from app._dubins_kernels import dubins_batch, mod2pi
+from app.app import app
+from app.dubins_paths import DubinsPathCalculator, DUBINS_PATH_TYPES
+from app.models import MAX_BATCH_SIZE, Pose2D
+
+TWO_PI = 2 * math.pi
+
+client = TestClient(app)
+
+def _mod2pi(theta):
+    return theta % TWO_PI
+
+def _heading_on_circle(center, point, s):
+    """Heading at ``point`` when moving around ``center`` with orientation s.
+
+    s = +1 is counter-clockwise, s = -1 clockwise (in atan2 terms).
+    """
+    ux = s * (point[0] - center[0])
+    uy = s * (point[1] - center[1])
+    return math.atan2(ux, -uy)
+
+def _reference_csc(c0, s0, c1, s1, th0, th1, r):
+    """Length of a circle-straight-circle path, or None if infeasible."""
+    dx, dy = c1[0] - c0[0], c1[1] - c0[1]
+    dist = math.hypot(dx, dy)
+    offset = r * (s0 - s1)
+    if abs(offset) > dist:
+        return None
+    if dist == 0:
+        # Same circle: a single arc
+        return r * _mod2pi(s0 * (th1 - th0))
+    psi = math.atan2(dy, dx) + math.asin(offset / dist)
+    straight = math.sqrt(max(dist * dist - offset * offset, 0.0))
+    return r * _mod2pi(s0 * (psi - th0)) + straight + r * _mod2pi(s1 * (th1 - psi))
+
+def _reference_ccc(c0, c1, s, th0, th1, r):
+    """Lengths of both circle-circle-circle paths (one per middle circle)."""
+    dx, dy = c1[0] - c0[0], c1[1] - c0[1]
+    dist = math.hypot(dx, dy)
+    if dist > 4 * r or dist == 0:
+        return []
+    h = math.sqrt(4 * r * r - (dist / 2) ** 2)
+    mx, my = (c0[0] + c1[0]) / 2, (c0[1] + c1[1]) / 2
+    lengths = []
+    for side in (1, -1):
+        cm = (mx - side * h * dy / dist, my + side * h * dx / dist)
+        q1 = ((c0[0] + cm[0]) / 2, (c0[1] + cm[1]) / 2)
+        q2 = ((cm[0] + c1[0]) / 2, (cm[1] + c1[1]) / 2)
+        psi1 = _heading_on_circle(c0, q1, s)
+        psi2 = _heading_on_circle(c1, q2, s)
+        lengths.append(
+            r * _mod2pi(s * (psi1 - th0))
+            + r * _mod2pi(-s * (psi2 - psi1))
+            + r * _mod2pi(s * (th1 - psi2))
+        )
+    return lengths
+
+def _random_pose(rng):
+    return Pose2D(x=rng.uniform(-5, 5), y=rng.uniform(-5, 5), theta=rng.uniform(-7, 7))
+
+def test_left_circle_center_convention():
+    calc = DubinsPathCalculator(min_radius=2.0)
+    pose = Pose2D(x=1.0, y=1.0, theta=0.0)
+    left = calc.left_circle_center(pose)
+    right = calc.right_circle_center(pose)
+    assert (left.x, left.y) == pytest.approx((1.0, -1.0))
+    assert (right.x, right.y) == pytest.approx((1.0, 3.0))
+
+    # A quarter turn around the left circle decreases the heading
+    path, _ = calc.compute_optimal_path(
+        pose, Pose2D(x=3.0, y=-1.0, theta=-math.pi / 2)
+    )
+    assert path.path_type.startswith("L")
+    assert path.total_length == pytest.approx(math.pi)
+
+def test_straight_and_u_turn():
+    calc = DubinsPathCalculator(min_radius=1.0)
+    path, _ = calc.compute_optimal_path(
+        Pose2D(x=0.0, y=0.0, theta=0.0), Pose2D(x=5.0, y=0.0, theta=0.0)
+    )
+    assert path.total_length == pytest.approx(5.0)
+
+    path, _ = calc.compute_optimal_path(
+        Pose2D(x=0.0, y=0.0, theta=0.0), Pose2D(x=0.0, y=2.0, theta=math.pi)
+    )
+    # Several words tie at a half turn; only the length is well defined
+    assert path.total_length == pytest.approx(math.pi)
+
+def test_word_lengths_match_reference():
+    rng = random.Random(0)
+    # Repo L turns clockwise in atan2 terms, R counter-clockwise
+    orientation = {"L": -1, "R": 1}
+    for _ in range(300):
+        r = rng.uniform(0.3, 3.0)
+        calc = DubinsPathCalculator(min_radius=r)
+        start, end = _random_pose(rng), _random_pose(rng)
+        lengths, best = calc._compute_all(start, end)
+        centers = {
+            "L": (calc.left_circle_center(start), calc.left_circle_center(end)),
+            "R": (calc.right_circle_center(start), calc.right_circle_center(end)),
+        }
+
+        for i, name in enumerate(DUBINS_PATH_TYPES):
+            first, last = centers[name[0]][0], centers[name[2]][1]
+            c0, c1 = (first.x, first.y), (last.x, last.y)
+            if name[1] == "S":
+                expected = _reference_csc(
+                    c0, orientation[name[0]], c1, orientation[name[2]],
+                    start.theta, end.theta, r
+                )
+                if expected is None:
+                    assert math.isinf(lengths[i]), name
+                else:
+                    assert lengths[i] == pytest.approx(expected, abs=1e-7), name
+            else:
+                candidates = _reference_ccc(
+                    c0, c1, orientation[name[0]], start.theta, end.theta, r
+                )
+                if not candidates:
+                    assert math.isinf(lengths[i]), name
+                else:
+                    assert min(abs(lengths[i] - c) for c in candidates) < 1e-7, name
+
+        assert lengths[best] == min(lengths)
+
+def test_mod2pi_large_angles():
+    for theta in (1e20, -1e20, 1e300, -3.0, 7.0):
+        wrapped = mod2pi(theta)
+        assert 0.0 <= wrapped < TWO_PI
+        assert wrapped == pytest.approx(theta % TWO_PI)
+
+def test_batch_kernel_large_heading():
+    types, lengths = dubins_batch(
+        np.array([[0.0, 0.0, 1e20]]), np.array([[3.0, 0.0, 0.0]]), 1.0
+    )
+    calc = DubinsPathCalculator(min_radius=1.0)
+    path, _ = calc.compute_optimal_path(
+        Pose2D(x=0.0, y=0.0, theta=1e20 % TWO_PI), Pose2D(x=3.0, y=0.0, theta=0.0)
+    )
+    assert lengths[0] >= 3.0
+    assert lengths[0] == pytest.approx(path.total_length, abs=1e-6)
+
+@pytest.mark.parametrize("radius", [1e-10, 1e-6, 1e3])
+def test_lengths_scale_with_radius(radius):
+    rng = random.Random(2)
+    unit = DubinsPathCalculator(min_radius=1.0)
+    calc = DubinsPathCalculator(min_radius=radius)
+    for _ in range(20):
+        start, end = _random_pose(rng), _random_pose(rng)
+        unit_lengths, unit_best = unit._compute_all(start, end)
+        # Same configuration scaled by the radius, anchored at the origin
+        lengths, best = calc._compute_all(
+            Pose2D(x=0.0, y=0.0, theta=start.theta),
+            Pose2D(x=(end.x - start.x) * radius, y=(end.y - start.y) * radius, theta=end.theta)
+        )
+        finite = np.isfinite(unit_lengths)
+        assert np.array_equal(finite, np.isfinite(lengths))
+        assert np.allclose(lengths[finite], unit_lengths[finite] * radius, rtol=1e-7, atol=0)
+        assert lengths[best] == pytest.approx(unit_lengths[unit_best] * radius, rel=1e-7)
+
+def test_compute_endpoint_all_paths():
+    response = client.post("/api/dubins/compute", json={
+        "start_pose": {"x": 0, "y": 0, "theta": 0},
+        "end_pose": {"x": 3, "y": 1, "theta": 1},
+        "compute_all": True,
+    })
+    assert response.status_code == 200
+    body = response.json()
+    lengths = [p["total_length"] for p in body["all_paths"]]
+    assert body["optimal_path"]["total_length"] == min(lengths)
+    assert {p["path_type"] for p in body["all_paths"]} <= set(DUBINS_PATH_TYPES)
+
+def test_batch_endpoint_matches_single():
+    rng = random.Random(1)
+    starts = [_random_pose(rng) for _ in range(50)]
+    ends = [_random_pose(rng) for _ in range(50)]
+    response = client.post("/api/dubins/compute_batch", json={
+        "starts": [{"x": p.x, "y": p.y, "theta": p.theta} for p in starts],
+        "ends": [{"x": p.x, "y": p.y, "theta": p.theta} for p in ends],
+        "min_radius": 1.5,
+    })
+    assert response.status_code == 200
+    body = response.json()
+
+    calc = DubinsPathCalculator(min_radius=1.5)
+    for start, end, length in zip(starts, ends, body["lengths"]):
+        path, _ = calc.compute_optimal_path(start, end)
+        assert length == pytest.approx(path.total_length, abs=1e-7)
+
+def test_endpoints_accept_tiny_radius():
+    start = {"x": 0, "y": 0, "theta": 0.3}
+    end = {"x": 3, "y": 4, "theta": -1.0}
+    response = client.post("/api/dubins/compute", json={
+        "start_pose": start, "end_pose": end, "min_radius": 1e-10,
+    })
+    assert response.status_code == 200
+    assert response.json()["optimal_path"]["total_length"] == pytest.approx(5.0, abs=1e-8)
+
+    response = client.post("/api/dubins/compute_batch", json={
+        "starts": [start], "ends": [end], "min_radius": 1e-10,
+    })
+    assert response.status_code == 200
+    assert response.json()["lengths"][0] == pytest.approx(5.0, abs=1e-8)
+
+def test_batch_endpoint_large_heading():
+    response = client.post("/api/dubins/compute_batch", json={
+        "starts": [{"x": 0, "y": 0, "theta": 1e20}],
+        "ends": [{"x": 3, "y": 0, "theta": 0}],
+    })
+    assert response.status_code == 200
+    assert response.json()["lengths"][0] >= 3.0
+
+@pytest.mark.parametrize("theta", [1e12, 1e17, 1e20])
+def test_batch_endpoint_large_heading_matches_single(theta):
+    # End off the x axis so that phi != 0
+    start = {"x": 0, "y": 0, "theta": theta}
+    end = {"x": 0, "y": 3, "theta": 0}
+    wrapped = {"x": 0, "y": 0, "theta": theta % TWO_PI}
+    batch = client.post("/api/dubins/compute_batch", json={
+        "starts": [start], "ends": [end],
+    }).json()
+    expected = client.post("/api/dubins/compute", json={
+        "start_pose": wrapped, "end_pose": end,
+    }).json()["optimal_path"]["total_length"]
+    single = client.post("/api/dubins/compute", json={
+        "start_pose": start, "end_pose": end,
+    }).json()["optimal_path"]["total_length"]
+    assert batch["lengths"][0] == pytest.approx(expected, abs=1e-9)
+    assert single == pytest.approx(expected, abs=1e-9)
+
+def test_batch_endpoint_rejects_oversized_batch():
+    poses = [{"x": 0, "y": 0, "theta": 0}] * (MAX_BATCH_SIZE + 1)
+    response = client.post("/api/dubins/compute_batch", json={
+        "starts": poses, "ends": poses,
+    })
+    assert response.status_code == 422
+
+def test_batch_endpoint_rejects_mismatched_lengths():
+    pose = {"x": 0, "y": 0, "theta": 0}
+    response = client.post("/api/dubins/compute_batch", json={
+        "starts": [pose, pose], "ends": [pose],
+    })
+    assert response.status_code == 400
+
+def test_envelope_endpoint():
+    centers = [(0, 0), (2, 0), (1, 1), (1, 3), (0.5, 0.5)]
+    response = client.post("/api/envelope/compute", json={
+        "disks": [{"center": {"x": x, "y": y, "theta": 0}, "radius": 1} for x, y in centers],
+    })
+    assert response.status_code == 200
+    body = response.json()
+    assert body["convex_hull_indices"] == [0, 1, 3]
+    assert [(p["x"], p["y"]) for p in body["envelope_points"]] == [(0, 0), (2, 0), (1, 3)]
+
+    response = client.post("/api/envelope/compute", json={"disks": []})
+    assert response.status_code == 200
+    assert response.json()["envelope_points"] == []
@@ -1,20 +1,27 @@
-import pypdf
+import fitz # PyMuPDF
 import os
 import glob
+from concurrent.futures import ProcessPoolExecutor
 
-pdf_files = glob.glob(r"c:\Users\tomas\OneDrive\Desktop\Knots\papers\*.pdf")
-for pdf in pdf_files:
+def extract_pdf(pdf):
     txt_path = pdf.replace(".pdf", ".txt")
-    if not os.path.exists(txt_path):
-        print(f"Extracting {pdf}...")
-        try:
-            with open(pdf, 'rb') as f:
-                reader = pypdf.PdfReader(f)
-                text = ''
-                for page in reader.pages:
-                    if page.extract_text():
-                        text += page.extract_text() + '\n\n'
-            with open(txt_path, 'w', encoding='utf-8') as f:
-                f.write(text)
-        except Exception as e:
-            print(f"Error on {pdf}: {e}")
+    print(f"Extracting {pdf}...")
+    try:
+        doc = fitz.open(pdf)
+        parts = []
+        for page in doc:
+            page_text = page.get_text()
+            if page_text:
+                parts.append(page_text + '\n\n')
+        text = ''.join(parts)
+        with open(txt_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+    except Exception as e:
+        print(f"Error on {pdf}: {e}")
+
+if __name__ == "__main__":
+    pdf_files = glob.glob(r"c:\Users\tomas\OneDrive\Desktop\Knots\papers\*.pdf")
+    pending = [pdf for pdf in pdf_files if not os.path.exists(pdf.replace(".pdf", ".txt"))]
+    # Each PDF goes to its own .txt, so workers never share an output file
+    with ProcessPoolExecutor() as executor:
+        list(executor.map(extract_pdf, pending))
@@ -1,21 +1,25 @@
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 
 papers_dir = os.path.join(os.path.dirname(__file__), '../papers')
 output_file = os.path.join(os.path.dirname(__file__), 'papers_text.txt')
 
 import fitz # PyMuPDF
-with open(output_file, 'w', encoding='utf-8') as f:
-    for file in os.listdir(papers_dir):
-        if file.endswith('.pdf'):
+
+def read_paper(file):
+    try:
+        doc = fitz.open(os.path.join(papers_dir, file))
+        return "".join(page.get_text() for page in doc[:3]) # First 3 pages of each
+    except Exception as e:
+        return f"Error: {e}\n"
+
+if __name__ == "__main__":
+    files = [file for file in os.listdir(papers_dir) if file.endswith('.pdf')]
+    # Workers only extract; the parent writes results in order to a single file
+    with ProcessPoolExecutor() as executor, open(output_file, 'w', encoding='utf-8') as f:
+        for file, text in zip(files, executor.map(read_paper, files)):
             f.write(f"\n\n{'='*40}\n--- Reading {file} ---\n{'='*40}\n\n")
-            try:
-                doc = fitz.open(os.path.join(papers_dir, file))
-                text = ""
-                for page in doc[:3]: # First 3 pages of each
-                    text += page.get_text()
-                f.write(text)
-            except Exception as e:
-                f.write(f"Error: {e}\n")
+            f.write(text)
 
-print(f"Done reading. Output saved to {output_file}")
+    print(f"Done reading. Output saved to {output_file}")
@@ -4,9 +4,10 @@ import sys
 def extract_text(pdf_path, txt_path):
     with open(pdf_path, 'rb') as f:
         reader = pypdf.PdfReader(f)
-        text = ''
+        parts = []
         for page in reader.pages:
-            text += page.extract_text() + '\n\n'
+            parts.append((page.extract_text() or '') + '\n\n')
+        text = ''.join(parts)
     with open(txt_path, 'w', encoding='utf-8') as f:
         f.write(text)
 